@@ -1,6 +1,5 @@
 import chex
 import jax.numpy as jnp
-from ..utils.eigen_decomp import full_eigen_decomp
 
 
 def min_gen_criterion(
@@ -34,13 +33,9 @@ def cma_criterion(
     """
     cma_term = 0
     dC = jnp.diag(state.strategy_state.C)
-    # Note: Criterion requires full covariance matrix for decomposition!
-    C, B, D = full_eigen_decomp(
-        state.strategy_state.C,
-        state.strategy_state.B,
-        state.strategy_state.D,
-        state.strategy_state.gen_counter,
-    )
+    # Note: Criterion requires eigendecomposition of full covariance matrix!
+    # (cached in the CMA-ES state and kept up to date in `tell`)
+    B, D = state.strategy_state.B, state.strategy_state.D
 
     # Stop if std of normal distrib is smaller than tolx in all coordinates
     # and pc is smaller than tolx in all components.
@@ -1,5 +1,6 @@
 from typing import Tuple, Optional, Union
 import jax
+import jax.numpy as jnp
 import chex
 from functools import partial
 from flax import struct
@@ -28,6 +29,7 @@ class BIPOP_CMA_ES(object):
         sigma_init: float = 1.0,
         mean_decay: float = 0.0,
         n_devices: Optional[int] = None,
+        sample_dtype: Optional[jnp.dtype] = None,
         **fitness_kwargs: Union[bool, int, float]
     ):
         """BIPOP-CMA-ES (Hansen, 2009).
@@ -43,6 +45,7 @@ class BIPOP_CMA_ES(object):
             sigma_init=sigma_init,
             mean_decay=mean_decay,
             n_devices=n_devices,
+            sample_dtype=sample_dtype,
             **fitness_kwargs,
         )
         from ..restarts import BIPOP_Restarter
@@ -54,6 +57,7 @@ class BIPOP_CMA_ES(object):
             strategy_kwargs={
                 "elite_ratio": elite_ratio,
                 "mean_decay": mean_decay,
+                "sample_dtype": sample_dtype,
             },
         )
 
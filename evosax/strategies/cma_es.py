@@ -12,8 +12,8 @@ class EvoState:
     p_sigma: chex.Array
     p_c: chex.Array
     C: chex.Array
-    D: Optional[chex.Array]
-    B: Optional[chex.Array]
+    D: chex.Array
+    B: chex.Array
     mean: chex.Array
     sigma: float
     weights: chex.Array
@@ -48,8 +48,8 @@ def get_cma_elite_weights(
 ) -> Tuple[chex.Array, chex.Array, float, float, float]:
     """Utility helper to create truncated elite weights for mean
     update and full weights for covariance update."""
-    weights_prime = jnp.array(
-        [jnp.log((popsize + 1) / 2) - jnp.log(i + 1) for i in range(popsize)]
+    weights_prime = jnp.log((popsize + 1) / 2) - jnp.log(
+        jnp.arange(1, popsize + 1)
     )
     mu_eff = (jnp.sum(weights_prime[:elite_popsize]) ** 2) / jnp.sum(
         weights_prime[:elite_popsize] ** 2
@@ -67,10 +67,15 @@ def get_cma_elite_weights(
         * (mu_eff - 2 + 1 / mu_eff)
         / ((max_dims_sq + 2) ** 2 + alpha_cov * mu_eff / 2),
     )
-    min_alpha = jnp.minimum(
-        1 + c_1 / c_mu, 1 + (2 * mu_eff_minus) / (mu_eff + 2)
+    min_alpha = jnp.min(
+        jnp.stack(
+            [
+                1 + c_1 / c_mu,
+                1 + (2 * mu_eff_minus) / (mu_eff + 2),
+                (1 - c_1 - c_mu) / (num_dims * c_mu),
+            ]
+        )
     )
-    min_alpha = jnp.minimum(min_alpha, (1 - c_1 - c_mu) / (num_dims * c_mu))
     positive_sum = jnp.sum(weights_prime * (weights_prime > 0))
     negative_sum = jnp.sum(jnp.abs(weights_prime * (weights_prime < 0)))
     weights = jnp.where(
@@ -92,6 +97,7 @@ class CMA_ES(Strategy):
         sigma_init: float = 1.0,
         mean_decay: float = 0.0,
         n_devices: Optional[int] = None,
+        sample_dtype: Optional[jnp.dtype] = None,
         **fitness_kwargs: Union[bool, int, float]
     ):
         """CMA-ES (e.g. Hansen, 2016)
@@ -113,6 +119,10 @@ class CMA_ES(Strategy):
         # Set core kwargs es_params
         self.sigma_init = sigma_init
 
+        # Optional lower precision (e.g. bfloat16) for sampling N(0, I) noise
+        # Noise is cast back to the precision of mean/C before being scaled
+        self.sample_dtype = sample_dtype
+
         # Robustness for int32 - squaring in hyperparameter calculations
         self.max_dims_sq = jnp.minimum(self.num_dims, 40000)
 
@@ -159,7 +169,7 @@ class CMA_ES(Strategy):
         weights, weights_truncated, _, _, _ = get_cma_elite_weights(
             self.popsize, self.elite_popsize, self.num_dims, self.max_dims_sq
         )
-        # Initialize evolution paths & covariance matrix
+        # Initialize evolution paths & covariance matrix (+ its eigendecomp.)
         initialization = jax.random.uniform(
             rng,
             (self.num_dims,),
@@ -169,11 +179,12 @@ class CMA_ES(Strategy):
         state = EvoState(
             p_sigma=jnp.zeros(self.num_dims),
             p_c=jnp.zeros(self.num_dims),
-            sigma=params.sigma_init,
+            # Strongly typed so that the state signature is fixed across gens
+            sigma=jnp.asarray(params.sigma_init, dtype=initialization.dtype),
             mean=initialization,
             C=jnp.eye(self.num_dims),
-            D=None,
-            B=None,
+            D=jnp.ones(self.num_dims),
+            B=jnp.eye(self.num_dims),
             weights=weights,
             weights_truncated=weights_truncated,
             best_member=initialization,
@@ -184,19 +195,18 @@ class CMA_ES(Strategy):
         self, rng: chex.PRNGKey, state: EvoState, params: EvoParams
     ) -> Tuple[chex.Array, EvoState]:
         """`ask` for new parameter candidates to evaluate next."""
-        C, B, D = full_eigen_decomp(
-            state.C, state.B, state.D, state.gen_counter
-        )
+        # Eigendecomposition of C is cached in state (updated in `tell`)
         x = sample(
             rng,
             state.mean,
             state.sigma,
-            B,
-            D,
+            state.B,
+            state.D,
             self.num_dims,
             self.popsize,
+            self.sample_dtype,
         )
-        return x, state.replace(C=C, B=B, D=D)
+        return x, state
 
     def tell_strategy(
         self,
@@ -207,26 +217,23 @@ class CMA_ES(Strategy):
     ) -> EvoState:
         """`tell` performance data for strategy state update."""
         # Sort new results, extract elite, store best performer
-        concat_p_f = jnp.hstack([jnp.expand_dims(fitness, 1), x])
-        sorted_solutions = concat_p_f[concat_p_f[:, 0].argsort()]
+        x_sorted = x[fitness.argsort()]
         # Update mean, isotropic/anisotropic paths, covariance, stepsize
         y_k, y_w, mean = update_mean(
             state.mean,
             state.sigma,
-            sorted_solutions,
+            x_sorted,
             params.c_m,
             state.weights_truncated,
         )
 
-        p_sigma, C_2, C, B, D = update_p_sigma(
-            state.C,
+        p_sigma = update_p_sigma(
             state.B,
             state.D,
             state.p_sigma,
             y_w,
             params.c_sigma,
             params.mu_eff,
-            state.gen_counter,
         )
 
         p_c, norm_p_sigma, h_sigma = update_p_c(
@@ -244,15 +251,18 @@ class CMA_ES(Strategy):
         C = update_covariance(
             mean,
             p_c,
-            C,
+            state.C,
             y_k,
             h_sigma,
-            C_2,
+            state.B,
+            state.D,
             state.weights,
             params.c_c,
             params.c_1,
             params.c_mu,
         )
+        # Covariance changed - recompute and cache its eigendecomposition
+        C, B, D = full_eigen_decomp(C)
         sigma = update_sigma(
             state.sigma,
             norm_p_sigma,
@@ -269,36 +279,32 @@ class CMA_ES(Strategy):
 def update_mean(
     mean: chex.Array,
     sigma: float,
-    sorted_solutions: chex.Array,
+    x_sorted: chex.Array,
     c_m: float,
     weights_truncated: chex.Array,
 ) -> Tuple[chex.Array, chex.Array, chex.Array]:
     """Update mean of strategy."""
-    x_k = sorted_solutions[:, 1:]  # ~ N(m, σ^2 C)
-    y_k = (x_k - mean) / sigma  # ~ N(0, C)
+    y_k = (x_sorted - mean) / sigma  # ~ N(0, C)
     y_w = jnp.sum(y_k.T * weights_truncated, axis=1)
     mean += c_m * sigma * y_w
     return y_k, y_w, mean
 
 
 def update_p_sigma(
-    C: chex.Array,
     B: chex.Array,
     D: chex.Array,
     p_sigma: chex.Array,
     y_w: chex.Array,
     c_sigma: float,
     mu_eff: float,
-    gen_counter: int,
-) -> Tuple[chex.Array, chex.Array, chex.Array, None, None]:
+) -> chex.Array:
     """Update evolution path for covariance matrix."""
-    C, B, D = full_eigen_decomp(C, B, D, gen_counter)
-    C_2 = B.dot(jnp.diag(1 / D)).dot(B.T)  # C^(-1/2) = B D^(-1) B^T
+    # C^(-1/2) y_w = B D^(-1) B^T y_w - without forming C^(-1/2) explicitly
+    C_2_y_w = B.dot(B.T.dot(y_w) / D)
     p_sigma_new = (1 - c_sigma) * p_sigma + jnp.sqrt(
         c_sigma * (2 - c_sigma) * mu_eff
-    ) * C_2.dot(y_w)
-    _B, _D = None, None
-    return p_sigma_new, C_2, C, _B, _D
+    ) * C_2_y_w
+    return p_sigma_new
 
 
 def update_p_c(
@@ -331,28 +337,29 @@ def update_covariance(
     C: chex.Array,
     y_k: chex.Array,
     h_sigma: float,
-    C_2: chex.Array,
+    B: chex.Array,
+    D: chex.Array,
     weights: chex.Array,
     c_c: float,
     c_1: float,
     c_mu: float,
 ) -> chex.Array:
     """Update cov. matrix estimator using rank 1 + μ updates."""
+    # ||C^(-1/2) y_k||^2 = ||D^(-1) B^T y_k||^2 since B is orthogonal
+    norm_sq = jnp.sum((y_k.dot(B) / D) ** 2, axis=1)
     w_io = weights * jnp.where(
         weights >= 0,
         1,
-        mean.shape[0] / (jnp.linalg.norm(C_2.dot(y_k.T), axis=0) ** 2 + 1e-20),
+        mean.shape[0] / (norm_sq + 1e-20),
     )
     delta_h_sigma = (1 - h_sigma) * c_c * (2 - c_c)
-    rank_one = jnp.outer(p_c, p_c)
-    rank_mu = jnp.sum(
-        jnp.array([w * jnp.outer(y, y) for w, y in zip(w_io, y_k)]), axis=0
-    )
+    # Rank-one (p_c) & rank-μ (y_k) terms as one weighted outer product sum
+    Y = jnp.concatenate([y_k, p_c[None, :]], axis=0)
+    w = jnp.append(c_mu * w_io, c_1)
+    rank_one_mu = (Y * w[:, None]).T.dot(Y)  # Single contraction over pop.
     C = (
-        (1 + c_1 * delta_h_sigma - c_1 - c_mu * jnp.sum(weights)) * C
-        + c_1 * rank_one
-        + c_mu * rank_mu
-    )
+        1 + c_1 * delta_h_sigma - c_1 - c_mu * jnp.sum(weights)
+    ) * C + rank_one_mu
     return C
 
 
@@ -378,10 +385,13 @@ def sample(
     D: chex.Array,
     n_dim: int,
     pop_size: int,
+    sample_dtype: Optional[jnp.dtype] = None,
 ) -> chex.Array:
     """Jittable Gaussian Sample Helper."""
-    z = jax.random.normal(rng, (n_dim, pop_size))  # ~ N(0, I)
-    y = B.dot(jnp.diag(D)).dot(z)  # ~ N(0, C)
-    y = jnp.swapaxes(y, 1, 0)
+    if sample_dtype is None:
+        sample_dtype = mean.dtype
+    z = jax.random.normal(rng, (pop_size, n_dim), dtype=sample_dtype)
+    z = z.astype(mean.dtype)  # ~ N(0, I)
+    y = (z * D).dot(B.T)  # ~ N(0, C)
     x = mean + sigma * y  # ~ N(m, σ^2 C)
     return x
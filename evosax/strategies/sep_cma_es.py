@@ -44,11 +44,8 @@ def get_cma_elite_weights(
 ) -> Tuple[chex.Array, chex.Array]:
     """Utility helper to create truncated elite weights for mean
     update and full weights for covariance update."""
-    weights_prime = jnp.array(
-        [
-            jnp.log(elite_popsize + 1) - jnp.log(i + 1)
-            for i in range(elite_popsize)
-        ]
+    weights_prime = jnp.log(elite_popsize + 1) - jnp.log(
+        jnp.arange(1, elite_popsize + 1)
     )
     weights = weights_prime / jnp.sum(weights_prime)
     weights_truncated = jnp.zeros(popsize)
@@ -1,5 +1,6 @@
 import jax
-from evosax import Strategies
+import jax.numpy as jnp
+from evosax import Strategies, CMA_ES
 from evosax.problems import BBOBFitness
 
 
@@ -34,3 +35,35 @@ def test_strategy_ask_tell(strategy_name):
     fitness = evaluator.rollout(rng, x)
     state = strategy.tell(x, fitness, state, params)
     return
+
+
+def test_cma_es_sample_dtype():
+    # Low precision noise sampling keeps state in the precision of the mean
+    rng = jax.random.PRNGKey(0)
+    strategy = CMA_ES(popsize=20, num_dims=2, sample_dtype=jnp.bfloat16)
+    params = strategy.default_params
+    state = strategy.initialize(rng, params)
+    evaluator = BBOBFitness("Sphere", num_dims=2)
+    for _ in range(2):
+        x, state = strategy.ask(rng, state, params)
+        fitness = evaluator.rollout(rng, x)
+        state = strategy.tell(x, fitness, state, params)
+    for a in [x, state.C, state.sigma]:
+        assert a.dtype == state.mean.dtype
+        assert jnp.all(jnp.isfinite(a))
+
+
+def test_cma_es_sigma_signature():
+    # State signature must not change across generations (no jit retracing)
+    rng = jax.random.PRNGKey(0)
+    strategy = CMA_ES(popsize=20, num_dims=2)
+    params = strategy.default_params
+    state = strategy.initialize(rng, params)
+    sigma_init = state.sigma
+    evaluator = BBOBFitness("Sphere", num_dims=2)
+    for _ in range(2):
+        x, state = strategy.ask(rng, state, params)
+        fitness = evaluator.rollout(rng, x)
+        state = strategy.tell(x, fitness, state, params)
+    assert state.sigma.dtype == sigma_init.dtype
+    assert state.sigma.weak_type == sigma_init.weak_type
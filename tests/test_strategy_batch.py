@@ -106,3 +106,24 @@ def test_protocol_best_subpop_strategy():
     state = batch_strategy.tell(x, fitness, state, es_params)
 
     assert state.mean.shape == (5, 2)
+
+
+def test_batch_cma_eigen_decomp():
+    rng = jax.random.PRNGKey(0)
+    batch_strategy = BatchStrategy(
+        strategy_name="CMA_ES",
+        num_dims=3,
+        popsize=40,
+        num_subpops=4,
+    )
+    es_params = batch_strategy.default_params
+    state = batch_strategy.initialize(rng, es_params)
+    x, state = batch_strategy.ask(rng, state, es_params)
+    fitness = jnp.sum(x ** 2, axis=1)
+    state = batch_strategy.tell(x, fitness, state, es_params)
+
+    # Eigendecomposition is cached per subpopulation in the batched state
+    assert state.B.shape == (4, 3, 3)
+    assert state.D.shape == (4, 3)
+    C_re = jnp.einsum("sij,sj,skj->sik", state.B, state.D ** 2, state.B)
+    assert jnp.allclose(C_re, state.C, atol=1e-5)